@@ -1,4 +1,4 @@
 from .figure import Figure
-from .simulation import Simulation, SimulationPool
+from .simulation import Simulation, SimulationPool, SimulationResult
 
-__all__ = ["Simulation", "SimulationPool", "Figure"]
+__all__ = ["Simulation", "SimulationPool", "SimulationResult", "Figure"]
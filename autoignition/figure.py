@@ -1,10 +1,25 @@
+from itertools import chain
 from typing import Iterable
 
 import numpy as np
 from matplotlib import pyplot as plt
+from matplotlib.collections import LineCollection
 import uncertainties
 from uncertainties import unumpy
 
+_UVAR_TYPE = uncertainties.UFloat  # Base class of Variable and derived quantities
+
+
+def _convert(x: float | np.ndarray) -> np.ndarray:
+    """Convert between temperature [K] and inverse temperature [1000 K/T].
+
+    The conversion is its own inverse and is applied to whole coordinate arrays
+    on every redraw, so it is vectorized (and tolerates the x == 0 probe
+    matplotlib makes when installing the secondary axis).
+    """
+    x = np.asarray(x, dtype=float)
+    return np.divide(1000.0, x, out=np.full_like(x, np.inf), where=x != 0)
+
 
 class Figure:
     """
@@ -36,10 +51,7 @@ class Figure:
         self.ax_inv.set_ylim(5e-5, 5e-3)
 
         # Create temperature axis
-        def convert(x: float) -> float:
-            return 1000.0 / x
-
-        self.ax_temp = self.ax_inv.secondary_xaxis("top", functions=(convert, convert))
+        self.ax_temp = self.ax_inv.secondary_xaxis("top", functions=(_convert, _convert))
 
         # Add labels
         self.ax_inv.set_ylabel(r"Ignition Delay Time [s]")
@@ -49,14 +61,27 @@ class Figure:
         # Property groups
         self.prop_groups: dict[str, dict] = {}
 
+        # Inverted temperature arrays keyed by input identity, so replotting the
+        # same temperature grid doesn't recompute the division
+        self._T_inv_cache: dict[int, tuple] = {}
+
+    def _invert_temperature(self, T: list[float] | np.ndarray) -> np.ndarray:
+        try:
+            return self._T_inv_cache[id(T)][1]
+        except KeyError:
+            T_inv = 1000.0 / np.asarray(T)
+            # Keep a reference to T so its id can't be reused by another object
+            self._T_inv_cache[id(T)] = (T, T_inv)
+            return T_inv
+
     def _get_group_props(self, groups: Iterable[str]) -> dict:
-        props = {}
-        for g in groups:
-            try:
-                props = props | self.prop_groups[g]
-            except KeyError:
-                raise ValueError(f"Invalid property group name: '{g}'")
-        return props
+        try:
+            # Single dict built in one pass; repeated `|` copies all keys per group
+            return dict(
+                chain.from_iterable(self.prop_groups[g].items() for g in groups)
+            )
+        except KeyError as e:
+            raise ValueError(f"Invalid property group name: {e}")
 
     @property
     def T_lim(self) -> tuple[float, float]:
@@ -90,24 +115,93 @@ class Figure:
             IDT: Ignition delay times [s].
             *groups: Property group names.
         """
-        props = self.exp_props
-        props = props | self._get_group_props(groups)  # Override properties with group properties
-        props = props | kwargs  # Override properties with keyword arguments
+        # Defaults overridden by group properties, overridden by keyword arguments
+        props = {**self.exp_props, **self._get_group_props(groups), **kwargs}
 
-        T_inv = 1000.0 / np.asarray(T)  # Invert temperature
+        T_inv = self._invert_temperature(T)
         IDT = np.asarray(IDT)
 
-        T_uncertainty = T_inv.dtype == uncertainties.core.Variable
-        IDT_uncertainty = IDT.dtype == uncertainties.core.Variable
+        # Check the first element rather than comparing dtypes; object arrays are
+        # only treated as uncertainty arrays if they actually hold UFloat values
+        T_uncertainty = (
+            T_inv.dtype.kind == "O"
+            and T_inv.size > 0
+            and isinstance(T_inv.flat[0], _UVAR_TYPE)
+        )
+        IDT_uncertainty = (
+            IDT.dtype.kind == "O"
+            and IDT.size > 0
+            and isinstance(IDT.flat[0], _UVAR_TYPE)
+        )
 
-        return self.ax_inv.errorbar(
-            unumpy.nominal_values(T_inv) if T_uncertainty else T_inv,
-            unumpy.nominal_values(IDT) if IDT_uncertainty else IDT,
-            unumpy.std_devs(IDT) if IDT_uncertainty else None,
-            unumpy.std_devs(T_inv) if T_uncertainty else None,
-            **props,
+        T_nom, T_err = (
+            (unumpy.nominal_values(T_inv), unumpy.std_devs(T_inv))
+            if T_uncertainty
+            else (T_inv, None)
+        )
+        IDT_nom, IDT_err = (
+            (unumpy.nominal_values(IDT), unumpy.std_devs(IDT))
+            if IDT_uncertainty
+            else (IDT, None)
         )
 
+        # Draw markers with a single scatter and all error bars with one
+        # LineCollection; `errorbar` creates one artist per bar, which is far
+        # slower to render for large experimental series
+        marker = props.pop("marker", "o")
+        capsize = props.pop("capsize", 0)
+        props.pop("linestyle", None)  # Markers only; error bars are solid segments
+        label = props.pop("label", None)
+        color = props.pop("color", None)
+        if color is None:
+            color = self.ax_inv._get_lines.get_next_color()
+
+        artists = [
+            self.ax_inv.scatter(
+                T_nom, IDT_nom, marker=marker, color=color, label=label, **props
+            )
+        ]
+
+        segments = []
+        cap_x, cap_y, cap_markers = [], [], []
+        if IDT_err is not None:
+            y_lo, y_hi = IDT_nom - IDT_err, IDT_nom + IDT_err
+            segments.append(
+                np.stack(
+                    [np.column_stack([T_nom, y_lo]), np.column_stack([T_nom, y_hi])],
+                    axis=1,
+                )
+            )
+            cap_x.append(np.concatenate([T_nom, T_nom]))
+            cap_y.append(np.concatenate([y_lo, y_hi]))
+            cap_markers.append("_")
+        if T_err is not None:
+            x_lo, x_hi = T_nom - T_err, T_nom + T_err
+            segments.append(
+                np.stack(
+                    [np.column_stack([x_lo, IDT_nom]), np.column_stack([x_hi, IDT_nom])],
+                    axis=1,
+                )
+            )
+            cap_x.append(np.concatenate([x_lo, x_hi]))
+            cap_y.append(np.concatenate([IDT_nom, IDT_nom]))
+            cap_markers.append("|")
+
+        if segments:
+            bars = LineCollection(np.concatenate(segments), colors=color)
+            self.ax_inv.add_collection(bars, autolim=False)
+            artists.append(bars)
+
+            if capsize:
+                for x, y, m in zip(cap_x, cap_y, cap_markers):
+                    artists.append(
+                        self.ax_inv.scatter(
+                            x, y, marker=m, color=color, s=(2 * capsize) ** 2
+                        )
+                    )
+
+        return artists
+
     def plot_sim(
         self,
         T: list[float] | np.ndarray,
@@ -122,11 +216,10 @@ class Figure:
             *groups: Property group names.
         """
 
-        props = self.sim_props
-        props = props | self._get_group_props(groups)  # Override properties with group properties
-        props = props | kwargs  # Override properties with keyword arguments
+        # Defaults overridden by group properties, overridden by keyword arguments
+        props = {**self.sim_props, **self._get_group_props(groups), **kwargs}
 
-        T_inv = 1000.0 / np.asarray(T)
+        T_inv = self._invert_temperature(T)
         return self.ax_inv.plot(T_inv, IDT, **props)
 
     def show(self):
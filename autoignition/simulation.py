@@ -1,11 +1,31 @@
 from concurrent.futures import ProcessPoolExecutor, Future
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 import cantera as ct
 import numpy as np
 import numpy.typing as npt
 import os
 
+# Per-process cache of parsed mechanisms; parsing a YAML mechanism can take
+# seconds for large mechanisms, so worker processes reuse the `Solution`
+_gas_cache: dict[str, ct.Solution] = {}
+
+
+def _get_gas(mech: str) -> ct.Solution:
+    gas = _gas_cache.get(mech)
+    if gas is None:
+        gas = _gas_cache[mech] = ct.Solution(mech)
+    return gas
+
+
+def _compute_idt(
+    mech: str, filepath: str, method: str, species: str | None
+) -> float | None:
+    # Runs in a worker process so the YAML decode and slope computation don't
+    # serialize on the main process
+    sim = Simulation.restore(filepath, mech)
+    return sim.ignition_delay_time(species, method=method)
+
 
 class Simulation:
     def __init__(
@@ -25,9 +45,73 @@ class Simulation:
 
         self.reactor = ct.Reactor(self.gas)
         self.reactor_net = ct.ReactorNet([self.reactor])
-        self.states = ct.SolutionArray(self.gas, extra=["t"])
 
-        self.states.append(self.reactor.thermo.state, t=0.0)  # Add initial state
+        # State history is accumulated in preallocated buffers that double in
+        # capacity as needed, and assembled into a `SolutionArray` lazily;
+        # appending to a `SolutionArray` every step is far more expensive than
+        # indexed writes plus a single bulk construction.
+        self._n = 0
+        self._cap = 256
+        self._t_buf = np.empty(self._cap)
+        self._T_buf = np.empty(self._cap)
+        self._P_buf = np.empty(self._cap)
+        self._Y_buf = np.empty((self._cap, self.gas.n_species))
+        self._record(0.0, self.reactor.thermo.T, self.reactor.thermo.P, self.reactor.thermo.Y)
+        self._states: ct.SolutionArray | None = None
+
+        # Cached arrays for repeated post-processing queries; each `SolutionArray`
+        # attribute access rebuilds a NumPy array from the underlying storage.
+        self._t_cache: npt.NDArray[np.float64] | None = None
+        self._T_cache: npt.NDArray[np.float64] | None = None
+        self._X_cache: dict[str, npt.NDArray[np.float64]] = {}
+
+        # Scratch buffers reused across ignition_delay_time calls
+        self._slope_buf = np.empty(0)
+        self._dt_buf = np.empty(0)
+
+    def _record(self, t: float, T: float, P: float, Y: np.ndarray):
+        if self._n == self._cap:
+            self._grow()
+        i = self._n
+        self._t_buf[i] = t
+        self._T_buf[i] = T
+        self._P_buf[i] = P
+        self._Y_buf[i] = Y
+        self._n = i + 1
+
+    def _grow(self):
+        # Doubling keeps the total copy cost amortized O(N)
+        self._cap *= 2
+        for name in ("_t_buf", "_T_buf", "_P_buf", "_Y_buf"):
+            old = getattr(self, name)
+            new = np.empty((self._cap, *old.shape[1:]))
+            new[: self._n] = old[: self._n]
+            setattr(self, name, new)
+
+    @property
+    def states(self) -> ct.SolutionArray:
+        """Simulation state history."""
+        if self._states is None:
+            n = self._n
+            states = ct.SolutionArray(self.gas, n, extra={"t": self._t_buf[:n]})
+            states.TPY = self._T_buf[:n], self._P_buf[:n], self._Y_buf[:n]
+            self._states = states
+        return self._states
+
+    @states.setter
+    def states(self, states: ct.SolutionArray):
+        self._states = states
+        self._n = self._cap = len(states.t)
+        self._t_buf = np.array(states.t)
+        self._T_buf = np.array(states.T)
+        self._P_buf = np.array(states.P)
+        self._Y_buf = np.array(states.Y)
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        self._t_cache = None
+        self._T_cache = None
+        self._X_cache.clear()
 
     def run(self, t: float = 1):
         """
@@ -36,9 +120,17 @@ class Simulation:
         Args:
             t: Simulation end time [s].
         """
-        while self.reactor_net.time < t:
-            self.reactor_net.step()
-            self.states.append(self.reactor.thermo.state, t=self.reactor_net.time)
+        # Bind hot-loop references once; the reactor exposes T and Y directly,
+        # avoiding a thermo attribute round-trip per step
+        reactor = self.reactor
+        reactor_net = self.reactor_net
+        thermo = reactor.thermo
+        while reactor_net.time < t:
+            reactor_net.step()
+            self._record(reactor_net.time, reactor.T, thermo.P, reactor.Y)
+
+        self._states = None  # Rebuilt lazily from the accumulated history
+        self._invalidate_caches()
 
         return self
 
@@ -88,17 +180,21 @@ class Simulation:
     @property
     def t(self) -> npt.NDArray[np.float64]:
         """Reactor elapsed time [s]."""
-        return self.states.t
+        if self._t_cache is None:
+            self._t_cache = self._t_buf[: self._n]
+        return self._t_cache
 
     @property
     def T(self) -> npt.NDArray[np.float64]:
         """Reactor temperature history [K]."""
-        return self.states.T
+        if self._T_cache is None:
+            self._T_cache = self._T_buf[: self._n]
+        return self._T_cache
 
     @property
     def P(self) -> npt.NDArray[np.float64]:
         """Reactor pressure history [Pa]."""
-        return self.states.P
+        return self._P_buf[: self._n]
 
     def X(self, species: str) -> npt.NDArray[np.float64]:
         """
@@ -108,7 +204,9 @@ class Simulation:
         Returns:
             Mole fraction history for the `species`.
         """
-        return self.states(species).X.flatten()
+        if species not in self._X_cache:
+            self._X_cache[species] = self.states(species).X.flatten()
+        return self._X_cache[species]
 
     def ignition_delay_time(
         self, species: str | None = None, *, method: str = "inflection"
@@ -132,18 +230,35 @@ class Simulation:
             Ignition delay time [s].
         """
 
-        x = self.T if species is None else self.X(species)
-        if method == "inflection":
-            i = np.argmax(np.diff(x) / np.diff(self.t))
-            return self.t[i] if i != len(self.t) - 2 else None
-        elif method == "max":
-            i = np.argmax(x)
-            return self.t[i] if i != len(self.t) - 1 else None
-        else:
+        try:
+            idt_method = self._IDT_METHODS[method]
+        except KeyError:
             raise ValueError(
                 f"Invalid method '{method}'; valid methods are 'inflection' and 'peak'."
             )
 
+        x = self.T if species is None else self.X(species)
+        return idt_method(self, x)
+
+    def _idt_inflection(self, x: npt.NDArray[np.float64]) -> float | None:
+        t = self.t
+        if self._slope_buf.size != x.size - 1:
+            self._slope_buf = np.empty(x.size - 1)
+            self._dt_buf = np.empty(x.size - 1)
+        slope = np.subtract(x[1:], x[:-1], out=self._slope_buf)
+        dt = np.subtract(t[1:], t[:-1], out=self._dt_buf)
+        np.divide(slope, dt, out=slope)
+        i = np.argmax(slope)
+        return t[i] if i != len(t) - 2 else None
+
+    def _idt_max(self, x: npt.NDArray[np.float64]) -> float | None:
+        t = self.t
+        i = np.argmax(x)
+        return t[i] if i != len(t) - 1 else None
+
+    # Dispatch table; a single hash lookup replaces chained string comparisons
+    _IDT_METHODS = {"inflection": _idt_inflection, "max": _idt_max}
+
     def get_top_species(
         self, n: int | None = None, *, exclude: str | list[str] | None = None
     ) -> list[str]:
@@ -156,35 +271,89 @@ class Simulation:
             List of top `n` species by mole fraction in descending order.
         """
 
-        X_max = np.max(self.states.X.T, axis=1)
-        species = [
-            t[1] for t in sorted(zip(X_max, self.states.species_names), reverse=True)
-        ]
+        if isinstance(exclude, str):
+            exclude = [exclude]
+
+        X_max = np.max(self.states.X, axis=0)  # Contiguous reduction, no transpose
+        k = None if n is None else n + (len(exclude) if exclude is not None else 0)
+        if k is not None and k < X_max.size:
+            # Partial partition is O(S) vs O(S log S) for a full sort
+            idx = np.argpartition(-X_max, k)[:k]
+            idx = idx[np.argsort(-X_max[idx])]
+        else:
+            idx = np.argsort(-X_max)
+        names = self.states.species_names
+        species = [names[i] for i in idx]
 
         if exclude is not None:
-            if isinstance(exclude, str):
-                exclude = [exclude]
-            for s in exclude:
-                try:
-                    species.remove(s.upper())
-                except ValueError:
-                    pass
+            excluded = {s.upper() for s in exclude}
+            species = [s for s in species if s not in excluded]
 
         return species[:n]
 
 
+class SimulationResult:
+    """
+    Lightweight simulation results returned by [`SimulationPool`][autoignition.SimulationPool]
+    when persistence is disabled.
+
+    Attributes:
+        t: Reactor elapsed time [s].
+        T: Reactor temperature history [K].
+        P: Reactor pressure history [Pa].
+    """
+
+    def __init__(
+        self,
+        t: npt.NDArray[np.float64],
+        T: npt.NDArray[np.float64],
+        P: npt.NDArray[np.float64],
+        idt: dict[str, float | None],
+    ):
+        self.t = t
+        self.T = T
+        self.P = P
+        self._idt = idt
+
+    def ignition_delay_time(self, *, method: str = "inflection") -> float | None:
+        """
+        Args:
+            method:
+                Method used to calculate ignition delay time.
+
+                  - 'inflection' (max slope)
+                  - 'max'
+
+        Returns:
+            Ignition delay time [s], precomputed by the worker process.
+        """
+        try:
+            return self._idt[method]
+        except KeyError:
+            raise ValueError(
+                f"Invalid method '{method}'; valid methods are 'inflection' and 'peak'."
+            )
+
+
 class SimulationPool:
     def __init__(
         self,
         max_workers: int | None = None,
         output_dir: str | None = None,
         process_func: Callable[[Simulation], Any] | None = None,
+        *,
+        persist: bool = False,
     ):
         """
         Args:
             max_workers: Maximum number of worker processes.
             output_dir: Directory to output simulation files.
             process_func: Optional function to process simulation results.
+            persist: Save full simulation state to disk so indexing the pool
+                returns a restored [`Simulation`][autoignition.Simulation]; by
+                default only the reduced histories are returned as a
+                [`SimulationResult`][autoignition.SimulationResult], skipping
+                the YAML round-trip.
         """
         self._max_workers = max_workers
         self.executor: ProcessPoolExecutor | None = None
@@ -192,6 +361,7 @@ class SimulationPool:
         self.parameters: dict[int, dict] = {}
         self._simulation_count: int = 0
         self.process_func = process_func
+        self.persist = persist
 
         self._output_dir = None
         self.output_dir = output_dir if output_dir is not None else "output"
@@ -207,12 +377,19 @@ class SimulationPool:
             self.executor.shutdown(wait=True)
         self.executor = None
 
-    def __getitem__(self, id: int) -> tuple[Simulation, Any]:
+    def __getitem__(self, id: int) -> tuple[Simulation | SimulationResult, Any]:
         try:
-            filepath, result = self.futures[id].result()
+            filepath, result, data = self.futures[id].result()
         except KeyError:
             raise ValueError("Invalid simulation ID.")
 
+        if filepath is None:
+            arrays = np.load(data["npz_path"])
+            return (
+                SimulationResult(arrays["t"], arrays["T"], arrays["P"], data["idt"]),
+                result,
+            )
+
         mech = self.parameters[id]["mech"]
         return Simulation.restore(filepath, mech), result
 
@@ -234,16 +411,81 @@ class SimulationPool:
         X,
         output_filepath: str,
         process_func: Callable[[Simulation], Any] | None = None,
-    ) -> tuple[str, Any]:
-        sim = Simulation(mech, T, P, X)
+        persist: bool = False,
+    ) -> tuple[str | None, Any, dict | None]:
+        sim = Simulation(_get_gas(mech), T, P, X)
         sim.run()
-        filepath = sim.save(output_filepath)
+
+        if persist:
+            filepath = sim.save(output_filepath)
+            data = None
+        else:
+            # Spill the reduced histories to a binary .npz and send only the
+            # path through the future; large arrays then never have to be
+            # pickled across the process boundary
+            npz_path = os.path.splitext(output_filepath)[0] + ".npz"
+            np.savez(npz_path, t=sim.t, T=sim.T, P=sim.P)
+            filepath = None
+            data = {
+                "npz_path": npz_path,
+                "idt": {
+                    method: sim.ignition_delay_time(method=method)
+                    for method in ("inflection", "max")
+                },
+            }
 
         result = None
         if process_func:
             result = process_func(sim)
 
-        return filepath, result
+        return filepath, result, data
+
+    def batch_ignition_delay_times(
+        self,
+        ids: Iterable[int],
+        *,
+        species: str | None = None,
+        method: str = "inflection",
+    ) -> list[float | None]:
+        """
+        Calculates ignition delay times for multiple simulations, distributing the
+        post-processing across the worker pool when it requires restoring saved state.
+
+        Args:
+            ids: Simulation ID numbers.
+            species: Name of species.
+            method:
+                Method used to calculate ignition delay time.
+
+                  - 'inflection' (max slope)
+                  - 'max'
+
+        Returns:
+            Ignition delay times [s] for each simulation ID.
+        """
+        if not self.persist:
+            if species is not None:
+                raise ValueError(
+                    "Species-based ignition delay times require a pool created "
+                    "with persist=True."
+                )
+            # Lean results already carry precomputed IDTs; no worker round-trip
+            return [self[id][0].ignition_delay_time(method=method) for id in ids]
+
+        if self.executor is None:
+            raise RuntimeError("ProcessPoolExecutor not initialized")
+
+        futures = [
+            self.executor.submit(
+                _compute_idt,
+                self.parameters[id]["mech"],
+                self.futures[id].result()[0],
+                method,
+                species,
+            )
+            for id in ids
+        ]
+        return [future.result() for future in futures]
 
     def submit_simulation(
         self, mech: str, T: float, P: float, X, *, filename: str | None = None
@@ -276,6 +518,7 @@ class SimulationPool:
                     filename if filename is not None else f"sim{id}.yaml",
                 ),
                 self.process_func,
+                self.persist,
             )
 
             return id
